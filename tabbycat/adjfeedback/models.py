@@ -136,6 +136,7 @@ class AdjudicatorFeedbackQuestion(models.Model):
         AdjudicatorFeedbackBooleanAnswer:
         [ANSWER_TYPE_BOOLEAN_SELECT, ANSWER_TYPE_BOOLEAN_CHECKBOX],
     }
+    ANSWER_RELATED_NAMES = [typ.__name__.lower() + '_set' for typ in ANSWER_TYPE_CLASSES_REVERSE]
     NUMERICAL_ANSWER_TYPES = [ANSWER_TYPE_INTEGER_TEXTBOX, ANSWER_TYPE_INTEGER_SCALE, ANSWER_TYPE_FLOAT]
 
     tournament = models.ForeignKey('tournaments.Tournament', models.CASCADE,
@@ -295,10 +296,12 @@ class AdjudicatorFeedback(Submission):
         return 1
 
     def get_answers(self):
+        if hasattr(self, '_answers'):  # Populated in bulk, e.g. by the API's feedback list
+            return self._answers
         return [
             {'question': q.question, 'answer': q.answer}
-            for typ in AdjudicatorFeedbackQuestion.ANSWER_TYPE_CLASSES_REVERSE.keys()
-            for q in getattr(self, typ.__name__.lower() + '_set').all()
+            for related_name in AdjudicatorFeedbackQuestion.ANSWER_RELATED_NAMES
+            for q in getattr(self, related_name).all()
         ]
 
     def clean(self):
@@ -1,7 +1,10 @@
 import operator
+from itertools import islice
 
+from django.http import StreamingHttpResponse
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAdminUser
+from rest_framework.renderers import JSONRenderer
 
 from tournaments.models import Round, Tournament
 
@@ -59,6 +62,42 @@ class RoundAPIMixin(TournamentAPIMixin):
         return context
 
 
+class StreamingListMixin:
+    """Streams list responses, serializing the queryset a chunk at a time
+    rather than materializing every object (and its prefetches) at once.
+    Caps the view's memory use at roughly `chunk_size` objects however large
+    the tournament is."""
+
+    chunk_size = 500
+
+    def process_chunk(self, chunk):
+        """Hook for views that bulk-populate attributes on the objects before
+        serialization; called with each chunk in turn."""
+        pass
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = JSONRenderer()
+
+        def stream():
+            iterator = queryset.iterator(chunk_size=self.chunk_size)
+            yield b'['
+            first = True
+            while True:
+                chunk = list(islice(iterator, self.chunk_size))
+                if len(chunk) == 0:
+                    break
+                if not first:
+                    yield b','
+                first = False
+                self.process_chunk(chunk)
+                serializer = self.get_serializer(chunk, many=True)
+                yield renderer.render(serializer.data)[1:-1]  # strip the chunk's enclosing brackets
+            yield b']'
+
+        return StreamingHttpResponse(stream(), content_type='application/json')
+
+
 class AdministratorAPIMixin:
     permission_classes = [APIEnabledPermission, IsAdminUser]
 
@@ -0,0 +1,62 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator which caches its count in the Django cache."""
+
+    cache_key = None
+    cache_timeout = 60
+    refresh = False
+
+    @cached_property
+    def count(self):
+        if self.cache_key is None:
+            return self.get_fresh_count()
+        if not self.refresh:
+            count = cache.get(self.cache_key)
+            if count is not None:
+                return count
+        count = self.get_fresh_count()
+        cache.set(self.cache_key, count, self.cache_timeout)
+        return count
+
+    def get_fresh_count(self):
+        try:
+            return self.object_list.count()
+        except (AttributeError, TypeError):
+            return len(self.object_list)
+
+
+class CachedCountPageNumberPagination(PageNumberPagination):
+    """Page-number pagination whose count query is briefly cached.
+
+    The count only changes when objects are created or deleted, but the stock
+    paginator recomputes it for every page fetched; with annotated or distinct
+    querysets that second query can cost as much as fetching the page itself.
+    Counts are keyed on the tournament, view, and query string, and refreshed
+    whenever the first page is requested so a new listing starts from an
+    up-to-date total."""
+
+    count_timeout = 60
+
+    def django_paginator_class(self, queryset, page_size):
+        paginator = CachedCountPaginator(queryset, page_size)
+        paginator.cache_key = self.count_cache_key
+        paginator.cache_timeout = self.count_timeout
+        paginator.refresh = self.requested_page in (None, '1')
+        return paginator
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.requested_page = request.query_params.get(self.page_query_param)
+        params = "&".join(
+            "%s=%s" % (param, value)
+            for param, value in sorted(request.query_params.items())
+            if param != self.page_query_param)
+        self.count_cache_key = "apicount:%s:%s:%s" % (
+            getattr(view, 'kwargs', {}).get('tournament_slug', ''),
+            view.__class__.__name__ if view is not None else '',
+            params)
+        return super().paginate_queryset(queryset, request, view)
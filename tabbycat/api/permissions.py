@@ -1,6 +1,26 @@
+from time import monotonic
+
 from dynamic_preferences.registries import global_preferences_registry
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+PREFERENCE_CACHE_TIMEOUT = 60
+
+_preference_cache = {}
+
+
+def tournament_pref(tournament, name):
+    """Looks up a tournament preference through a short-lived process-local
+    memo. The preferences manager caches values in the Django cache, but where
+    that is a network service the lookup is still a round trip, and permission
+    checks make one on every public API request. Accessing a preference this
+    way means tolerating up to a minute of staleness after it is changed."""
+    key = (tournament.id, name)
+    value, expires = _preference_cache.get(key, (None, 0))
+    if monotonic() >= expires:
+        value = tournament.pref(name)
+        _preference_cache[key] = (value, monotonic() + PREFERENCE_CACHE_TIMEOUT)
+    return value
+
 
 class APIEnabledPermission(BasePermission):
     message = "The API has been disabled on this site."
@@ -17,8 +37,8 @@ class PublicPreferencePermission(BasePermission):
 
     def get_tournament_preference(self, view, op):
         if type(view.access_preference) is tuple:
-            return op(view.tournament.pref(pref) for pref in view.access_preference)
-        return op(view.tournament.pref(view.access_preference), view.access_setting)
+            return op(tournament_pref(view.tournament, pref) for pref in view.access_preference)
+        return op(tournament_pref(view.tournament, view.access_preference), view.access_setting)
 
 
 class PublicIfReleasedPermission(PublicPreferencePermission):
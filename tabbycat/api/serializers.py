@@ -1,5 +1,6 @@
 from collections import OrderedDict
 from collections.abc import Mapping
+from copy import copy, deepcopy
 from functools import partialmethod
 from urllib import parse
 
@@ -11,7 +12,7 @@ from django.utils import timezone
 from django.utils.encoding import uri_to_iri
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from rest_framework.fields import get_error_detail, SkipField
+from rest_framework.fields import Field, get_error_detail, SkipField
 from rest_framework.relations import Hyperlink
 from rest_framework.settings import api_settings
 
@@ -36,6 +37,65 @@ from . import fields
 from .utils import is_staff
 
 
+class CachedFieldsSerializerMixin:
+    """Caches the fields returned by get_fields() on the serializer class.
+
+    Constructing fields re-introspects the model on every request, which adds
+    up with nested serializers, despite only depending on the class. Copies of
+    the cached fields are returned so that binding them, or removing fields
+    from a particular instance, does not affect other instances. Fields with
+    children bound at construction time (ListSerializer's child,
+    ManyRelatedField's child_relation, nested serializers' own fields) must be
+    deep copies, as a shallow copy would share the child, whose .parent - and
+    so whose .context - would still point at the unbound cached original."""
+
+    def get_fields(self):
+        cls = self.__class__
+        if '_fields_cache' not in cls.__dict__:
+            cls._fields_cache = super().get_fields()
+
+        fields = OrderedDict()
+        for name, field in cls._fields_cache.items():
+            if isinstance(field, serializers.BaseSerializer) or hasattr(field, 'child') or hasattr(field, 'child_relation'):
+                fields[name] = deepcopy(field)
+            else:
+                fields[name] = copy(field)
+        return fields
+
+
+class FastAttributeSerializerMixin:
+    """Serializes with a plain getattr() where that is equivalent to the
+    field's get_attribute(), which generalises over dotted sources, callables
+    and defaults. The distinction only depends on the bound fields, so it is
+    worked out once per serializer instance; with many=True, the one child
+    serializer handles every object, so large lists hit the fast path with
+    next to no bookkeeping."""
+
+    def to_representation(self, instance):
+        if not hasattr(self, '_field_attrs'):
+            self._field_attrs = [
+                (field, field.source_attrs[0]
+                    if type(field).get_attribute is Field.get_attribute and len(field.source_attrs) == 1
+                    else None)
+                for field in self._readable_fields
+            ]
+
+        ret = OrderedDict()
+        for field, attr in self._field_attrs:
+            if attr is not None:
+                attribute = getattr(instance, attr, None)
+            if attr is None or attribute is None or callable(attribute):
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+            if attribute is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+        return ret
+
+
 def _validate_field(self, field, value):
     if value is None:
         return None
@@ -158,7 +218,7 @@ class VenueConstraintSerializer(serializers.ModelSerializer):
         fields = ('category', 'priority')
 
 
-class TournamentSerializer(serializers.ModelSerializer):
+class TournamentSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
 
     url = serializers.HyperlinkedIdentityField(
         view_name='api-tournament-detail',
@@ -217,7 +277,7 @@ class TournamentSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class RoundSerializer(serializers.ModelSerializer):
+class RoundSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class RoundMotionSerializer(serializers.ModelSerializer):
         id = serializers.IntegerField(source='motion.pk', read_only=True)
         url = fields.TournamentHyperlinkedRelatedField(required=False,
@@ -379,7 +439,7 @@ class RoundSerializer(serializers.ModelSerializer):
         return ret
 
 
-class MotionSerializer(serializers.ModelSerializer):
+class MotionSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class RoundsSerializer(serializers.ModelSerializer):
         # Should these be filtered if unreleased?
         round = fields.TournamentHyperlinkedRelatedField(view_name='api-round-detail',
@@ -409,7 +469,7 @@ class MotionSerializer(serializers.ModelSerializer):
         return motion
 
 
-class BreakCategorySerializer(serializers.ModelSerializer):
+class BreakCategorySerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
 
     class BreakCategoryLinksSerializer(serializers.Serializer):
         eligibility = fields.TournamentHyperlinkedIdentityField(
@@ -430,7 +490,7 @@ class BreakCategorySerializer(serializers.ModelSerializer):
     validate_seq = partialmethod(_validate_field, 'seq')
 
 
-class SpeakerCategorySerializer(serializers.ModelSerializer):
+class SpeakerCategorySerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
 
     class SpeakerCategoryLinksSerializer(serializers.Serializer):
         eligibility = fields.TournamentHyperlinkedIdentityField(
@@ -493,7 +553,7 @@ class SpeakerEligibilitySerializer(BaseEligibilitySerializer):
         fields = ('slug', participants_field)
 
 
-class BreakingTeamSerializer(serializers.ModelSerializer):
+class BreakingTeamSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     team = fields.TournamentHyperlinkedRelatedField(view_name='api-team-detail', queryset=Team.objects.all())
 
     class Meta:
@@ -520,7 +580,7 @@ class PartialBreakingTeamSerializer(BreakingTeamSerializer):
         return bt
 
 
-class SpeakerSerializer(serializers.ModelSerializer):
+class SpeakerSerializer(CachedFieldsSerializerMixin, FastAttributeSerializerMixin, serializers.ModelSerializer):
 
     class SpeakerLinksSerializer(serializers.Serializer):
         checkin = fields.TournamentHyperlinkedIdentityField(tournament_field='team__tournament', view_name='api-speaker-checkin')
@@ -567,7 +627,7 @@ class SpeakerSerializer(serializers.ModelSerializer):
         return speaker
 
 
-class AdjudicatorSerializer(serializers.ModelSerializer):
+class AdjudicatorSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
 
     class AdjudicatorLinksSerializer(serializers.Serializer):
         checkin = fields.TournamentHyperlinkedIdentityField(view_name='api-adjudicator-checkin')
@@ -662,7 +722,7 @@ class AdjudicatorSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(CachedFieldsSerializerMixin, FastAttributeSerializerMixin, serializers.ModelSerializer):
     class TeamSpeakerSerializer(SpeakerSerializer):
         team = None
 
@@ -695,7 +755,9 @@ class TeamSerializer(serializers.ModelSerializer):
         exclude = ('tournament', 'type')
 
     def __init__(self, *args, **kwargs):
-        self.fields['speakers'] = self.TeamSpeakerSerializer(*args, many=True, required=False, **kwargs)
+        # Read from the concrete list prefetched to_attr, avoiding a queryset
+        # clone of speaker_set per team in list views.
+        self.fields['speakers'] = self.TeamSpeakerSerializer(*args, many=True, required=False, source='_speakers', **kwargs)
 
         super().__init__(*args, **kwargs)
 
@@ -720,6 +782,11 @@ class TeamSerializer(serializers.ModelSerializer):
 
     validate_emoji = partialmethod(_validate_field, 'emoji')
 
+    def to_representation(self, instance):
+        if not hasattr(instance, '_speakers'):  # Not prefetched, e.g. a newly created team
+            instance._speakers = list(instance.speaker_set.all())
+        return super().to_representation(instance)
+
     def validate(self, data):
         if data.get('institution') is None and data.get('use_institution_prefix', False):
             raise serializers.ValidationError("Cannot include institution prefix without institution.")
@@ -744,7 +811,7 @@ class TeamSerializer(serializers.ModelSerializer):
         if len(validated_data.get('short_reference', "")) == 0:
             validated_data['short_reference'] = validated_data['reference'][:34]
 
-        speakers_data = validated_data.pop('speakers', [])
+        speakers_data = validated_data.pop('_speakers', [])
         break_categories = validated_data.pop('break_categories', [])
         venue_constraints = validated_data.pop('venue_constraints', [])
 
@@ -781,7 +848,7 @@ class TeamSerializer(serializers.ModelSerializer):
         return team
 
     def update(self, instance, validated_data):
-        speakers_data = validated_data.pop('speakers', [])
+        speakers_data = validated_data.pop('_speakers', [])
         venue_constraints = validated_data.pop('venue_constraints', [])
         if len(speakers_data) > 0:
             speakers = SpeakerSerializer(many=True, context=self.context)
@@ -795,7 +862,7 @@ class TeamSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class InstitutionSerializer(serializers.ModelSerializer):
+class InstitutionSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     url = serializers.HyperlinkedIdentityField(view_name='api-global-institution-detail')
     region = fields.CreatableSlugRelatedField(slug_field='name', queryset=Region.objects.all(), required=False)
     venue_constraints = VenueConstraintSerializer(many=True, required=False)
@@ -854,7 +921,7 @@ class PerTournamentInstitutionSerializer(InstitutionSerializer):
             self.fields.pop('adjudicators')
 
 
-class VenueSerializer(serializers.ModelSerializer):
+class VenueSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
 
     class VenueLinksSerializer(serializers.Serializer):
         checkin = fields.TournamentHyperlinkedIdentityField(view_name='api-venue-checkin')
@@ -874,7 +941,7 @@ class VenueSerializer(serializers.ModelSerializer):
         exclude = ('tournament',)
 
 
-class VenueCategorySerializer(serializers.ModelSerializer):
+class VenueCategorySerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     url = fields.TournamentHyperlinkedIdentityField(view_name='api-venuecategory-detail')
     venues = fields.TournamentHyperlinkedRelatedField(
         many=True,
@@ -949,7 +1016,7 @@ class DebateAdjudicatorSerializer(serializers.Serializer):
         return aa
 
 
-class RoundPairingSerializer(serializers.ModelSerializer):
+class RoundPairingSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class DebateTeamSerializer(serializers.ModelSerializer):
         team = fields.TournamentHyperlinkedRelatedField(view_name='api-team-detail', queryset=Team.objects.all())
 
@@ -1010,7 +1077,7 @@ class RoundPairingSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class FeedbackQuestionSerializer(serializers.ModelSerializer):
+class FeedbackQuestionSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     url = fields.TournamentHyperlinkedIdentityField(view_name='api-feedbackquestion-detail')
 
     class Meta:
@@ -1021,7 +1088,7 @@ class FeedbackQuestionSerializer(serializers.ModelSerializer):
     validate_seq = partialmethod(_validate_field, 'seq')
 
 
-class FeedbackSerializer(TabroomSubmissionFieldsMixin, serializers.ModelSerializer):
+class FeedbackSerializer(CachedFieldsSerializerMixin, TabroomSubmissionFieldsMixin, serializers.ModelSerializer):
 
     class SubmitterSourceField(BaseSourceField):
         field_source_name = 'source'
@@ -1131,7 +1198,7 @@ class FeedbackSerializer(TabroomSubmissionFieldsMixin, serializers.ModelSerializ
         return super().update(instance, validated_data)
 
 
-class BallotSerializer(TabroomSubmissionFieldsMixin, serializers.ModelSerializer):
+class BallotSerializer(CachedFieldsSerializerMixin, TabroomSubmissionFieldsMixin, serializers.ModelSerializer):
 
     class ResultSerializer(serializers.Serializer):
         class SheetSerializer(serializers.Serializer):
@@ -1349,7 +1416,7 @@ class UpdateBallotSerializer(serializers.ModelSerializer):
         fields = ('confirmed', 'discarded')
 
 
-class PreformedPanelSerializer(serializers.ModelSerializer):
+class PreformedPanelSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     url = fields.RoundHyperlinkedIdentityField(view_name='api-preformedpanel-detail', lookup_url_kwarg='debate_pk')
     adjudicators = DebateAdjudicatorSerializer(required=False, allow_null=True)
 
@@ -1379,7 +1446,7 @@ class PreformedPanelSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class SpeakerRoundScoresSerializer(serializers.ModelSerializer):
+class SpeakerRoundScoresSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class RoundScoresSerializer(serializers.ModelSerializer):
         class RoundSpeechSerializer(serializers.ModelSerializer):
             class Meta:
@@ -1404,7 +1471,7 @@ class SpeakerRoundScoresSerializer(serializers.ModelSerializer):
         fields = ('speaker', 'rounds')
 
 
-class TeamRoundScoresSerializer(serializers.ModelSerializer):
+class TeamRoundScoresSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
 
     class ScoreSerializer(serializers.ModelSerializer):
         round = fields.TournamentHyperlinkedRelatedField(view_name='api-round-detail', source='debate.round',
@@ -0,0 +1,44 @@
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from api.serializers import CachedFieldsSerializerMixin
+
+
+class ValueSerializer(serializers.Serializer):
+    value = serializers.SerializerMethodField()
+
+    def get_value(self, obj):
+        return self.context['multiplier'] * obj['value']
+
+
+class CachedFieldsSerializer(CachedFieldsSerializerMixin, serializers.Serializer):
+    name = serializers.CharField()
+    items = ValueSerializer(many=True)
+
+
+class CachedFieldsSerializerMixinTests(SimpleTestCase):
+    """Checks that fields served from the mixin's cache behave as freshly
+    constructed fields, in particular that many=True fields don't share a
+    child bound to the cached original, which would see an empty context."""
+
+    data = {'name': 'test', 'items': [{'value': 1}, {'value': 2}]}
+
+    def test_context_reaches_child_of_many_field(self):
+        for i in range(2):  # The second run serves fields from the cache
+            serializer = CachedFieldsSerializer(self.data, context={'multiplier': 10})
+            with self.subTest(run=i):
+                self.assertEqual(serializer.data['items'], [{'value': 10}, {'value': 20}])
+
+    def test_instances_do_not_share_fields(self):
+        first = CachedFieldsSerializer(self.data, context={'multiplier': 1})
+        second = CachedFieldsSerializer(self.data, context={'multiplier': 1})
+        self.assertIsNot(first.fields['name'], second.fields['name'])
+        self.assertIsNot(first.fields['items'], second.fields['items'])
+        self.assertIsNot(first.fields['items'].child, second.fields['items'].child)
+
+    def test_removing_field_does_not_affect_other_instances(self):
+        first = CachedFieldsSerializer(self.data, context={'multiplier': 1})
+        first.fields.pop('items')
+        second = CachedFieldsSerializer(self.data, context={'multiplier': 1})
+        self.assertNotIn('items', first.fields)
+        self.assertIn('items', second.fields)
@@ -170,6 +170,9 @@ urlpatterns = [
                     path('',
                         views.AdjudicatorViewSet.as_view(list_methods),
                         name='api-adjudicator-list'),
+                    path('/checkins',
+                        views.BulkAdjudicatorCheckinsView.as_view(),
+                        name='api-adjudicator-checkins'),
                     path('/<int:pk>', include([
                         path('',
                             views.AdjudicatorViewSet.as_view(detail_methods),
@@ -183,6 +186,9 @@ urlpatterns = [
                     path('',
                          views.SpeakerViewSet.as_view(list_methods),
                          name='api-speaker-list'),
+                    path('/checkins',
+                        views.BulkSpeakerCheckinsView.as_view(),
+                        name='api-speaker-checkins'),
                     path('/<int:pk>', include([
                         path('',
                             views.SpeakerViewSet.as_view(detail_methods),
@@ -207,6 +213,9 @@ urlpatterns = [
                     path('',
                         views.VenueViewSet.as_view(list_methods),
                         name='api-venue-list'),
+                    path('/checkins',
+                        views.BulkVenueCheckinsView.as_view(),
+                        name='api-venue-checkins'),
                     path('/<int:pk>', include([
                         path('',
                             views.VenueViewSet.as_view(detail_methods),
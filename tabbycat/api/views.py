@@ -1,15 +1,19 @@
+import json
 from copy import deepcopy
+from functools import lru_cache
 from itertools import groupby
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Count, Prefetch, Q
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Exists, Max, OuterRef, Prefetch, Q
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from dynamic_preferences.api.serializers import PreferenceSerializer
 from dynamic_preferences.api.viewsets import PerInstancePreferenceViewSet
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.fields import DateTimeField
 from rest_framework.generics import GenericAPIView, get_object_or_404, RetrieveUpdateAPIView
 from rest_framework.response import Response
@@ -17,14 +21,14 @@ from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
-from adjallocation.models import PreformedPanel
+from adjallocation.models import DebateAdjudicator, PreformedPanel
 from adjallocation.preformed.anticipated import calculate_anticipated_draw
 from adjfeedback.models import AdjudicatorFeedbackQuestion
 from availability.models import RoundAvailability
 from breakqual.models import BreakCategory
 from breakqual.views import GenerateBreakMixin
 from checkins.consumers import CheckInEventConsumer
-from checkins.models import Event
+from checkins.models import Event, PersonIdentifier, VenueIdentifier
 from checkins.utils import create_identifiers, get_unexpired_checkins
 from draw.models import Debate, DebateTeam
 from options.models import TournamentPreferenceModel
@@ -38,8 +42,8 @@ from venues.models import Venue, VenueCategory
 
 from . import serializers
 from .fields import ParticipantAvailabilityForeignKeyField
-from .mixins import AdministratorAPIMixin, PublicAPIMixin, RoundAPIMixin, TournamentAPIMixin, TournamentPublicAPIMixin
-from .permissions import APIEnabledPermission, PublicPreferencePermission
+from .mixins import AdministratorAPIMixin, PublicAPIMixin, RoundAPIMixin, StreamingListMixin, TournamentAPIMixin, TournamentPublicAPIMixin
+from .permissions import APIEnabledPermission, PublicPreferencePermission, tournament_pref
 
 
 tournament_parameter = OpenApiParameter('tournament_slug', description="The tournament's slug", type=str, location="path")
@@ -54,20 +58,61 @@ debate_parameters = [
 id_parameter = OpenApiParameter('id', description="The object's primary key", type=int, location="path")
 
 
+@lru_cache(maxsize=None)
+def reverse_path(view_name, format=None):
+    """Resolves the path of a static (argument-less) route. reverse() walks
+    the entire URL resolver, so resolve each such route just once."""
+    return reverse(view_name, format=format)
+
+
+def defer_tournament_columns(*relations):
+    """Defers all Tournament columns other than the primary key and slug on
+    the given relations, for querysets that join the tournament purely to
+    construct hyperlinks."""
+    deferrable = [f.name for f in Tournament._meta.concrete_fields if f.name not in ('id', 'slug')]
+    return [relation + '__' + f for relation in relations for f in deferrable]
+
+
+# For prefetches of tournaments joined purely to construct hyperlinks,
+# which only need the slug (and primary key, for the join itself).
+tournament_links_queryset = Tournament.objects.only('id', 'slug')
+
+
+# Unions the feedback answer tables; built once as the tables never change.
+FEEDBACK_ANSWERS_SQL = " UNION ALL ".join(
+    "SELECT feedback_id, question_id, to_jsonb(answer)::text FROM %s WHERE feedback_id = ANY(%%s)" % typ._meta.db_table
+    for typ in AdjudicatorFeedbackQuestion.ANSWER_TYPE_CLASSES_REVERSE
+) + " ORDER BY question_id"
+
+# For feedback fetched outside the bulk-populated list action, whose answers
+# come from get_answers()'s per-type loop.
+FEEDBACK_ANSWER_PREFETCHES = [
+    Prefetch(related_name, queryset=typ.objects.all().select_related('question', 'question__tournament'))
+    for related_name, typ in zip(AdjudicatorFeedbackQuestion.ANSWER_RELATED_NAMES,
+                                 AdjudicatorFeedbackQuestion.ANSWER_TYPE_CLASSES_REVERSE)
+]
+
+
 @extend_schema(tags=['root'], summary="API root")
 class APIRootView(PublicAPIMixin, GenericAPIView):
     name = "API Root"
     serializer_class = serializers.RootSerializer
 
-    def get(self, request, format=None):
-        """API Entrypoint; info about versions"""
-        return Response({
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_response_dict(base_url, format=None):
+        return {
             "_links": {
-                "v1": reverse('api-v1-root', request=request, format=format),
+                "v1": base_url + reverse_path('api-v1-root', format),
             },
             "timezone": settings.TIME_ZONE,
             "version": settings.TABBYCAT_VERSION,
-        })
+        }
+
+    def get(self, request, format=None):
+        """API Entrypoint; info about versions"""
+        # The response only varies with the requested host, so build it once per host.
+        return Response(self.get_response_dict("%s://%s" % (request.scheme, request.get_host()), format))
 
 
 @extend_schema(tags=['root'], summary="API v1 root")
@@ -77,16 +122,19 @@ class APIV1RootView(PublicAPIMixin, GenericAPIView):
     lookup_field = 'slug'
     lookup_url_kwarg = 'tournament_slug'
 
-    def get(self, request, format=None):
-        """Entrypoint for version 1 of the API"""
-        tournaments_create_url = reverse('api-tournament-list', request=request, format=format)
-        institution_create_url = reverse('api-global-institution-list', request=request, format=format)
-        return Response({
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_response_dict(base_url, format=None):
+        return {
             "_links": {
-                "tournaments": tournaments_create_url,
-                "institutions": institution_create_url,
+                "tournaments": base_url + reverse_path('api-tournament-list', format),
+                "institutions": base_url + reverse_path('api-global-institution-list', format),
             },
-        })
+        }
+
+    def get(self, request, format=None):
+        """Entrypoint for version 1 of the API"""
+        return Response(self.get_response_dict("%s://%s" % (request.scheme, request.get_host()), format))
 
 
 @extend_schema(tags=['tournaments'])
@@ -103,7 +151,8 @@ class TournamentViewSet(PublicAPIMixin, ModelViewSet):
     queryset = Tournament.objects.all().prefetch_related(
         'breakcategory_set',
         Prefetch('round_set',
-            queryset=Round.objects.filter(completed=False).annotate(Count('debate')).order_by('seq'),
+            queryset=Round.objects.filter(completed=False).annotate(
+                has_debates=Exists(Debate.objects.filter(round=OuterRef('pk')))).order_by('seq'),
             to_attr='current_round_set'),
     )
     serializer_class = serializers.TournamentSerializer
@@ -303,10 +352,16 @@ class InstitutionViewSet(TournamentAPIMixin, TournamentPublicAPIMixin, ModelView
         if self.request.query_params.get('region'):
             filters &= Q(region__name=self.request.query_params['region'])
 
+        # Collect the institutions represented with two cheap indexed queries
+        # and a union in Python, rather than joining, which would require
+        # DISTINCT over the product of the adjudicator and team rows.
+        ids = set(Adjudicator.objects.filter(tournament=self.tournament).values_list('institution_id', flat=True))
+        ids |= set(Team.objects.filter(tournament=self.tournament).values_list('institution_id', flat=True))
+        ids.discard(None)
+
         return Institution.objects.filter(
-            Q(adjudicator__tournament=self.tournament) | Q(team__tournament=self.tournament),
-            filters,
-        ).distinct().select_related('region').prefetch_related(
+            filters, pk__in=ids,
+        ).select_related('region').prefetch_related(
             Prefetch('team_set', queryset=self.tournament.team_set.all()),
             Prefetch('adjudicator_set', queryset=self.tournament.adjudicator_set.all()),
             'venue_constraints__category__tournament',
@@ -327,19 +382,31 @@ class TeamViewSet(TournamentAPIMixin, TournamentPublicAPIMixin, ModelViewSet):
     access_preference = 'public_participants'
 
     def get_queryset(self):
-        category_prefetch = Prefetch('categories', queryset=SpeakerCategory.objects.all().select_related('tournament'))
+        category_prefetch = Prefetch('categories',
+            queryset=SpeakerCategory.objects.all().select_related('tournament').defer(*defer_tournament_columns('tournament')))
         if not self.request.user or not self.request.user.is_staff:
             category_prefetch.queryset = category_prefetch.queryset.filter(public=True)
 
-        return super().get_queryset().select_related('tournament').prefetch_related(
+        qs = super().get_queryset().select_related('tournament').defer(*defer_tournament_columns('tournament')).prefetch_related(
             Prefetch(
                 'speaker_set',
-                queryset=Speaker.objects.all().prefetch_related(category_prefetch).select_related('team__tournament'),
+                queryset=Speaker.objects.all().prefetch_related(category_prefetch).select_related(
+                    'team__tournament').defer(*defer_tournament_columns('team__tournament')),
+                to_attr='_speakers',
             ),
             'institution_conflicts', 'venue_constraints__category__tournament',
             'break_categories', 'break_categories__tournament',
         )
 
+        # Skip fetching columns the serializer won't show in list responses.
+        if self.action == 'list':
+            deferred = ['type']  # Always excluded by the serializer
+            if (not self.request.user or not self.request.user.is_staff) and \
+                    self.tournament.pref('team_code_names') in ('admin-tooltips-code', 'admin-tooltips-real', 'everywhere'):
+                deferred += ['use_institution_prefix', 'reference', 'short_reference', 'short_name', 'long_name']
+            qs = qs.defer(*deferred)
+        return qs
+
 
 @extend_schema(tags=['adjudicators'], parameters=[tournament_parameter])
 @extend_schema_view(
@@ -364,12 +431,17 @@ class AdjudicatorViewSet(TournamentAPIMixin, TournamentPublicAPIMixin, ModelView
         if self.request.query_params.get('break') and self.get_break_permission():
             filters &= Q(breaking=True)
 
-        return super().get_queryset().prefetch_related(
-            'team_conflicts', 'team_conflicts__tournament',
-            'adjudicator_conflicts', 'adjudicator_conflicts__tournament',
+        qs = super().get_queryset().prefetch_related(
+            'team_conflicts', Prefetch('team_conflicts__tournament', queryset=tournament_links_queryset),
+            'adjudicator_conflicts', Prefetch('adjudicator_conflicts__tournament', queryset=tournament_links_queryset),
             'institution_conflicts', 'venue_constraints__category__tournament',
         ).filter(filters)
 
+        # Skip fetching columns the serializer removes from public list responses.
+        if self.action == 'list' and (not self.request.user or not self.request.user.is_staff):
+            qs = qs.defer('base_score', 'trainee', 'gender', 'email', 'phone', 'pronoun', 'url_key')
+        return qs
+
 
 @extend_schema(tags=['institutions'])
 @extend_schema_view(
@@ -431,8 +503,9 @@ class VenueViewSet(TournamentAPIMixin, PublicAPIMixin, ModelViewSet):
 
     def get_queryset(self):
         # Tournament must exist for URLs
-        return super().get_queryset().select_related('tournament').prefetch_related(
-            Prefetch('venuecategory_set', queryset=VenueCategory.objects.select_related('tournament').filter(tournament__isnull=False)))
+        return super().get_queryset().select_related('tournament').defer(*defer_tournament_columns('tournament')).prefetch_related(
+            Prefetch('venuecategory_set', queryset=VenueCategory.objects.select_related('tournament').filter(
+                tournament__isnull=False).defer(*defer_tournament_columns('tournament'))))
 
 
 @extend_schema(tags=['venues'], parameters=[tournament_parameter])
@@ -449,8 +522,9 @@ class VenueCategoryViewSet(TournamentAPIMixin, PublicAPIMixin, ModelViewSet):
 
     def get_queryset(self):
         # Tournament must exist for URLs
-        return super().get_queryset().select_related('tournament').prefetch_related(
-            Prefetch('venues', queryset=Venue.objects.select_related('tournament').filter(tournament__isnull=False)))
+        return super().get_queryset().select_related('tournament').defer(*defer_tournament_columns('tournament')).prefetch_related(
+            Prefetch('venues', queryset=Venue.objects.select_related('tournament').filter(
+                tournament__isnull=False).defer(*defer_tournament_columns('tournament'))))
 
 
 @extend_schema(tags=['checkins'], parameters=[tournament_parameter, id_parameter])
@@ -463,7 +537,9 @@ class BaseCheckinsView(AdministratorAPIMixin, TournamentAPIMixin, APIView):
     def get_object_queryset(self):
         lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
         filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
-        return self.get_queryset().filter(**filter_kwargs)
+        events = get_unexpired_checkins(self.tournament, self.window_preference_pref).filter(
+            identifier=OuterRef('checkin_identifier'))
+        return self.get_queryset().filter(**filter_kwargs).annotate(checked=Exists(events))
 
     def get_object(self):
         obj = get_object_or_404(self.get_object_queryset())
@@ -475,73 +551,97 @@ class BaseCheckinsView(AdministratorAPIMixin, TournamentAPIMixin, APIView):
             raise NotFound(detail='No identifier. Use POST to generate.')
         return obj
 
-    def broadcast_checkin(self, obj, check):
-        # Send result to websocket for treatment when opened; but perform the action here
-        checkin = None
+    def broadcast_checkins(self, objs, check):
+        # Send results to websocket for treatment when opened; but perform the
+        # action here. However many objects are given, their events are created
+        # in bulk and dispatched in a single group message.
+        checkins = []
+        checkin_dicts = []
         if check:
-            checkin = Event.objects.create(identifier=obj.checkin_identifier,
-                                           tournament=self.tournament)
-            checkin_dict = checkin.serialize()
-            checkin_dict['owner_name'] = obj.name
+            checkins = [Event(identifier=obj.checkin_identifier, tournament=self.tournament) for obj in objs]
+            Event.objects.bulk_create(checkins)
+            for obj, checkin in zip(objs, checkins):
+                checkin_dict = checkin.serialize()
+                checkin_dict['owner_name'] = obj.name
+                checkin_dicts.append(checkin_dict)
         else:
-            checkins = get_unexpired_checkins(self.tournament, self.window_preference_pref)
-            checkins.filter(identifier=obj.checkin_identifier).delete()
-            checkin_dict = {'identifier': obj.checkin_identifier.barcode}
+            events = get_unexpired_checkins(self.tournament, self.window_preference_pref)
+            events.filter(identifier__in=[obj.checkin_identifier for obj in objs]).delete()
+            checkin_dicts = [{'identifier': obj.checkin_identifier.barcode} for obj in objs]
 
         group_name = CheckInEventConsumer.group_prefix + "_" + self.tournament.slug
         async_to_sync(get_channel_layer().group_send)(group_name, {
             'type': 'send_json',
-            'checkins': [checkin_dict],
+            'checkins': checkin_dicts,
             'created': check,
         })
-        return checkin
+        return checkins
+
+    _object_url_templates = {}
+
+    def get_object_url(self, request, obj, format=None):
+        """As reverse() walks the URL resolver per call, resolve the object
+        URL once per view and tournament with a placeholder pk, and cache it
+        as a template into which subsequent pks are substituted."""
+        if format is not None:
+            return reverse(self.object_api_view,
+                kwargs={'tournament_slug': self.tournament.slug, 'pk': obj.pk},
+                request=request, format=format)
+
+        key = (self.object_api_view, self.tournament.slug)
+        template = self._object_url_templates.get(key)
+        if template is None:
+            path = reverse(self.object_api_view, kwargs={'tournament_slug': self.tournament.slug, 'pk': 0})
+            template = path[:-1] + '{pk}'  # The pk is the final URL component
+            self._object_url_templates[key] = template
+        return request.build_absolute_uri(template.format(pk=obj.pk))
 
     def get_response_dict(self, request, obj, checked, event, **kwargs):
         return {
-            'object': reverse(
-                self.object_api_view,
-                kwargs={'tournament_slug': self.tournament.slug, 'pk': obj.pk},
-                request=request,
-                format=kwargs.get('format'),
-            ),
+            'object': self.get_object_url(request, obj, format=kwargs.get('format')),
             'barcode': obj.checkin_identifier.barcode,
             'checked': checked,
             'timestamp': DateTimeField().to_representation(event.time) if event is not None else None,
         }
 
     def get_queryset(self):
-        return self.model.objects.filter(**self.lookup_kwargs()).select_related(self.tournament_field)
+        # Selecting the identifier also caches its absence, so the hasattr()
+        # check in get_object() doesn't lazily query for it.
+        return self.model.objects.filter(**self.lookup_kwargs()).select_related(
+            self.tournament_field, 'checkin_identifier')
 
     @extend_schema(request=None, responses=serializers.CheckinSerializer)
     def get(self, request, *args, **kwargs):
         """Get checkin status"""
-        obj = self.get_object()
+        obj = self.get_object()  # Annotated with whether an unexpired checkin exists
 
-        event = get_unexpired_checkins(self.tournament, self.window_preference_pref).filter(identifier=obj.checkin_identifier)
-        return Response(self.get_response_dict(request, obj, event.exists(), event.first()))
+        event = None
+        if obj.checked:
+            event = get_unexpired_checkins(self.tournament, self.window_preference_pref).filter(
+                identifier=obj.checkin_identifier).first()
+        return Response(self.get_response_dict(request, obj, obj.checked, event))
 
     @extend_schema(request=None, responses={200: serializers.CheckinSerializer})
     def delete(self, request, *args, **kwargs):
         """Checks out"""
         obj = self.get_object()
-        self.broadcast_checkin(obj, False)
+        self.broadcast_checkins([obj], False)
         return Response(self.get_response_dict(request, obj, False, None))
 
     @extend_schema(request=None, responses=serializers.CheckinSerializer)
     def put(self, request, *args, **kwargs):
         """Checks in"""
         obj = self.get_object()
-        e = self.broadcast_checkin(obj, True)
-        return Response(self.get_response_dict(request, obj, True, e))
+        events = self.broadcast_checkins([obj], True)
+        return Response(self.get_response_dict(request, obj, True, events[0]))
 
     @extend_schema(request=None, responses=serializers.CheckinSerializer)
     def patch(self, request, *args, **kwargs):
         """Toggles the check-in status"""
-        obj = self.get_object()
-        events = get_unexpired_checkins(self.tournament, self.window_preference_pref).filter(identifier=obj.checkin_identifier)
-        check = events.exists()
-        e = self.broadcast_checkin(obj, not check)
-        return Response(self.get_response_dict(request, obj, not check, e))
+        obj = self.get_object()  # Annotated with whether an unexpired checkin exists
+        events = self.broadcast_checkins([obj], not obj.checked)
+        event = events[0] if len(events) > 0 else None
+        return Response(self.get_response_dict(request, obj, not obj.checked, event))
 
     @extend_schema(request=None, responses=serializers.CheckinSerializer)
     def post(self, request, *args, **kwargs):
@@ -550,7 +650,7 @@ class BaseCheckinsView(AdministratorAPIMixin, TournamentAPIMixin, APIView):
         if not obj.exists():
             raise NotFound("Object could not be found")
         status = 200 if hasattr(obj, 'checkin_identifier') else 201
-        create_identifiers(self.model.checkin_identifier.related.related_model, obj)
+        create_identifiers(self.identifier_model, obj)
         return Response(self.get_response_dict(request, obj.get(), False, None), status=status)
 
 
@@ -564,6 +664,7 @@ class BaseCheckinsView(AdministratorAPIMixin, TournamentAPIMixin, APIView):
 )
 class AdjudicatorCheckinsView(BaseCheckinsView):
     model = Adjudicator
+    identifier_model = PersonIdentifier
     object_api_view = 'api-adjudicator-detail'
     window_preference_pref = 'checkin_window_people'
 
@@ -578,6 +679,7 @@ class AdjudicatorCheckinsView(BaseCheckinsView):
 )
 class SpeakerCheckinsView(BaseCheckinsView):
     model = Speaker
+    identifier_model = PersonIdentifier
     object_api_view = 'api-speaker-detail'
     window_preference_pref = 'checkin_window_people'
     tournament_field = 'team__tournament'
@@ -593,10 +695,82 @@ class SpeakerCheckinsView(BaseCheckinsView):
 )
 class VenueCheckinsView(BaseCheckinsView):
     model = Venue
+    identifier_model = VenueIdentifier
     object_api_view = 'api-venue-detail'
     window_preference_pref = 'checkin_window_venues'
 
 
+pk_list_schema = {'application/json': {'type': 'array', 'items': {'type': 'integer'}}}
+
+
+class BaseBulkCheckinsView(BaseCheckinsView):
+    """Checks many objects in or out in one request, given a list of their
+    primary keys. The events are created in bulk and all of the checkins
+    travel in a single websocket message, rather than one dispatch per
+    object as with the single-object endpoints."""
+
+    name = "Bulk check-ins"
+
+    http_method_names = ['put', 'delete', 'options']
+
+    def get_objects(self):
+        pks = self.request.data
+        if not isinstance(pks, list) or len(pks) == 0 or not all(isinstance(pk, int) for pk in pks):
+            raise ValidationError("Expected a non-empty list of primary keys.")
+
+        events = get_unexpired_checkins(self.tournament, self.window_preference_pref).filter(
+            identifier=OuterRef('checkin_identifier'))
+        objs = list(self.get_queryset().filter(pk__in=pks).annotate(checked=Exists(events)))
+
+        if len(objs) != len(set(pks)):
+            raise NotFound(detail='Some objects could not be found.')
+        if not all(hasattr(obj, 'checkin_identifier') for obj in objs):
+            raise NotFound(detail='No identifier. Use POST to generate.')
+        return objs
+
+    @extend_schema(request=pk_list_schema, responses=serializers.CheckinSerializer(many=True))
+    def put(self, request, *args, **kwargs):
+        """Checks in all the given objects"""
+        objs = self.get_objects()
+        events = self.broadcast_checkins(objs, True)
+        return Response([self.get_response_dict(request, obj, True, event)
+                         for obj, event in zip(objs, events)])
+
+    @extend_schema(request=pk_list_schema, responses=serializers.CheckinSerializer(many=True))
+    def delete(self, request, *args, **kwargs):
+        """Checks out all the given objects"""
+        objs = self.get_objects()
+        self.broadcast_checkins(objs, False)
+        return Response([self.get_response_dict(request, obj, False, None) for obj in objs])
+
+
+@extend_schema(tags=['adjudicators'], parameters=[tournament_parameter])
+@extend_schema_view(
+    put=extend_schema(summary="Check in adjudicators"),
+    delete=extend_schema(summary="Check out adjudicators"),
+)
+class BulkAdjudicatorCheckinsView(BaseBulkCheckinsView, AdjudicatorCheckinsView):
+    pass
+
+
+@extend_schema(tags=['teams'], parameters=[tournament_parameter])
+@extend_schema_view(
+    put=extend_schema(summary="Check in speakers"),
+    delete=extend_schema(summary="Check out speakers"),
+)
+class BulkSpeakerCheckinsView(BaseBulkCheckinsView, SpeakerCheckinsView):
+    pass
+
+
+@extend_schema(tags=['venues'], parameters=[tournament_parameter])
+@extend_schema_view(
+    put=extend_schema(summary="Check in rooms"),
+    delete=extend_schema(summary="Check out rooms"),
+)
+class BulkVenueCheckinsView(BaseBulkCheckinsView, VenueCheckinsView):
+    pass
+
+
 def get_metrics_params(generator):
     metrics = {
         'type': 'array',
@@ -620,6 +794,8 @@ class BaseStandingsView(TournamentAPIMixin, TournamentPublicAPIMixin, GenericAPI
     lookup_field = 'slug'
     lookup_url_kwarg = 'tournament_slug'
 
+    cache_timeout = settings.PUBLIC_SLOW_CACHE_TIMEOUT
+
     def get_metrics(self):
         if self.request.query_params.get('metrics'):
             return self.request.query_params.get('metrics').split(","), self.request.query_params.get('extra_metrics').split(",")
@@ -639,6 +815,16 @@ class BaseStandingsView(TournamentAPIMixin, TournamentPublicAPIMixin, GenericAPI
             return Round.objects.get(tournament=self.tournament, seq=int(self.request.query_params.get('round')))
         return None
 
+    def get_cache_key(self, metrics, extra_metrics):
+        completed_seq = self.tournament.round_set.filter(completed=True).aggregate(seq=Max('seq'))['seq'] or 0
+        # The payload contains absolute URLs, so key on the scheme and host too.
+        return "apistandings:%s://%s:%s:%d:%d:%s:%s:%s:%s" % (
+            self.request.scheme, self.request.get_host(),
+            self.__class__.__name__, self.tournament.id, completed_seq,
+            ",".join(metrics), ",".join(extra_metrics),
+            self.request.query_params.get('category', ''), self.request.query_params.get('round', ''),
+        )
+
     @extend_schema(tags=['standings'], parameters=[
         tournament_parameter,
         OpenApiParameter('category', description='Only include participants in a category (ID)', required=False, type=int),
@@ -647,10 +833,15 @@ class BaseStandingsView(TournamentAPIMixin, TournamentPublicAPIMixin, GenericAPI
     def get(self, request, **kwargs):
         """Get current standings"""
         metrics, extra_metrics = self.get_metrics()
-        generator = self.generator(metrics, ('rank',), extra_metrics)
-        standings = generator.generate(self.get_queryset(), round=self.get_max_round())
-        serializer = self.get_serializer(iter(standings), many=True)
-        return Response(serializer.data)
+        key = self.get_cache_key(metrics, extra_metrics)
+        data = cache.get(key)
+        if data is None:
+            generator = self.generator(metrics, ('rank',), extra_metrics)
+            standings = generator.generate(self.get_queryset(), round=self.get_max_round())
+            serializer = self.get_serializer(iter(standings), many=True)
+            data = serializer.data
+            cache.set(key, data, self.cache_timeout)
+        return Response(data)
 
 
 @extend_schema_view(
@@ -773,7 +964,7 @@ class TeamRoundStandingsRoundsView(TournamentAPIMixin, TournamentPublicAPIMixin,
     partial_update=extend_schema(summary="Patch pairing", parameters=debate_parameters),
     destroy=extend_schema(summary="Delete pairing", parameters=debate_parameters),
 )
-class PairingViewSet(RoundAPIMixin, ModelViewSet):
+class PairingViewSet(StreamingListMixin, RoundAPIMixin, ModelViewSet):
 
     class Permission(PublicPreferencePermission):
         def get_tournament_preference(self, view, op):
@@ -784,10 +975,10 @@ class PairingViewSet(RoundAPIMixin, ModelViewSet):
                 'off': False,
                 'current': t.current_round.id == r.id and self.get_round_status(view),
                 'all-released': self.get_round_status(view),
-            }[t.pref(view.access_preference)]
+            }[tournament_pref(t, view.access_preference)]
 
-            result_status = t.pref('public_results') and r.completed and not r.silent
-            return draw_status or result_status or t.pref('all_results_released')
+            result_status = tournament_pref(t, 'public_results') and r.completed and not r.silent
+            return draw_status or result_status or tournament_pref(t, 'all_results_released')
 
         def get_round_status(self, view):
             return getattr(view.round, view.round_released_field) == view.round_released_value
@@ -804,8 +995,8 @@ class PairingViewSet(RoundAPIMixin, ModelViewSet):
 
     def get_queryset(self):
         return super().get_queryset().select_related('round', 'round__tournament', 'venue', 'venue__tournament').prefetch_related(
-            'debateteam_set', 'debateteam_set__team', 'debateteam_set__team__tournament',
-            'debateadjudicator_set', 'debateadjudicator_set__adjudicator', 'debateadjudicator_set__adjudicator__tournament',
+            Prefetch('debateteam_set', queryset=DebateTeam.objects.select_related('team__tournament')),
+            Prefetch('debateadjudicator_set', queryset=DebateAdjudicator.objects.select_related('adjudicator__tournament')),
         )
 
     @extend_schema(summary="Delete all pairings in the round")
@@ -910,7 +1101,7 @@ class FeedbackQuestionViewSet(TournamentAPIMixin, PublicAPIMixin, ModelViewSet):
     partial_update=extend_schema(summary="Patch feedback", parameters=[id_parameter]),
     destroy=extend_schema(summary="Delete feedback", parameters=[id_parameter]),
 )
-class FeedbackViewSet(TournamentAPIMixin, AdministratorAPIMixin, ModelViewSet):
+class FeedbackViewSet(StreamingListMixin, TournamentAPIMixin, AdministratorAPIMixin, ModelViewSet):
     serializer_class = serializers.FeedbackSerializer
     tournament_field = 'adjudicator__tournament'
 
@@ -934,14 +1125,7 @@ class FeedbackViewSet(TournamentAPIMixin, AdministratorAPIMixin, ModelViewSet):
         if query_params.get('target'):
             filters &= Q(adjudicator_id=query_params.get('target'))
 
-        answers_prefetch = [
-            Prefetch(
-                typ.__name__.lower() + "_set",
-                queryset=typ.objects.all().select_related('question', 'question__tournament'),
-            )
-            for typ in AdjudicatorFeedbackQuestion.ANSWER_TYPE_CLASSES_REVERSE.keys()
-        ]
-        return super().get_queryset().filter(filters).select_related(
+        qs = super().get_queryset().filter(filters).select_related(
             'adjudicator', 'adjudicator__tournament',
             'source_adjudicator', 'source_team', 'source_team__team',
             'source_adjudicator__adjudicator__tournament', 'source_team__team__tournament',
@@ -949,7 +1133,38 @@ class FeedbackViewSet(TournamentAPIMixin, AdministratorAPIMixin, ModelViewSet):
             'source_adjudicator__debate__round', 'source_team__debate__round',
             'source_adjudicator__debate__round__tournament', 'source_team__debate__round__tournament',
             'participant_submitter__adjudicator__tournament', 'participant_submitter__speaker__team__tournament',
-        ).prefetch_related(*answers_prefetch)
+        )
+
+        # The list action populates answers in bulk per chunk; other actions
+        # fall back to get_answers(), which needs the per-type prefetches.
+        if self.action != 'list':
+            qs = qs.prefetch_related(*FEEDBACK_ANSWER_PREFETCHES)
+        return qs
+
+    def populate_answers(self, feedbacks):
+        """Attaches the answers of the given feedbacks as would get_answers(),
+        but fetching all of the answer tables in one UNION query rather than
+        one query per answer type. The answers are converted to JSON in the
+        query so that their Python types survive the union."""
+        if len(feedbacks) == 0:
+            return
+
+        questions = {q.id: q for q in
+            self.tournament.adjudicatorfeedbackquestion_set.select_related('tournament')}
+        n_answer_types = len(AdjudicatorFeedbackQuestion.ANSWER_TYPE_CLASSES_REVERSE)
+
+        ids = [feedback.id for feedback in feedbacks]
+        answers = {feedback.id: [] for feedback in feedbacks}
+        with connection.cursor() as cursor:
+            cursor.execute(FEEDBACK_ANSWERS_SQL, [ids] * n_answer_types)
+            for feedback_id, question_id, answer in cursor.fetchall():
+                answers[feedback_id].append({'question': questions[question_id], 'answer': json.loads(answer)})
+
+        for feedback in feedbacks:
+            feedback._answers = answers[feedback.id]
+
+    def process_chunk(self, chunk):
+        self.populate_answers(chunk)
 
 
 @extend_schema(tags=['availabilities'], parameters=round_parameters)
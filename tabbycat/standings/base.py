@@ -333,8 +333,10 @@ class BaseStandingsGenerator:
         # The original queryset might have filtered out information relevant to
         # calculating the metrics (e.g., if it filters teams by participation in
         # a round), so make a new queryset to pass to the metric annotators that
-        # relies on a nested ID selection instead.
-        queryset_for_metrics = queryset.model.objects.filter(id__in=queryset.values_list('id', flat=True))
+        # relies on an ID selection instead. The IDs come from the instances
+        # already fetched for the Standings object, so the metric queries don't
+        # repeat the original queryset's joins and filters as a subquery.
+        queryset_for_metrics = queryset.model.objects.filter(id__in=[info.instance_id for info in standings.infos.values()])
 
         self._annotate_metrics(queryset_for_metrics, self.distinct_queryset_metric_annotators, standings, round)
 
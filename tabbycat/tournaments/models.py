@@ -2,7 +2,7 @@ import logging
 
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -239,15 +239,20 @@ class Tournament(models.Model):
         This should be kept consistent with Tournament.rounds_for_nav and
         Round.is_current."""
 
+        from draw.models import Debate
+
         # For something this complicated it's easier just to get the entire
-        # round set from the database, and process it in Python.
+        # round set from the database, and process it in Python. Only whether
+        # a draw exists matters, so annotate with EXISTS rather than a count,
+        # which Postgres can answer from the foreign key index alone.
         rounds = getattr(self, 'current_round_set',
-            self.round_set.filter(completed=False).annotate(Count('debate')).order_by('seq'))
+            self.round_set.filter(completed=False).annotate(
+                has_debates=Exists(Debate.objects.filter(round=OuterRef('pk')))).order_by('seq'))
         current_elim_rounds = {}
         for r in rounds:
             if not r.is_break_round:
                 return [r]  # short-circuit everything else
-            elif r.debate__count > 0:
+            elif r.has_debates:
                 current_elim_rounds.setdefault(r.break_category_id, r)
         return [
             current_elim_rounds.get(category.pk)